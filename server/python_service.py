@@ -3,200 +3,424 @@ Python Backend Service for Financial Calculations using NumPy
 Provides statistical analysis, trend analysis, and risk metrics for financial data
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 import numpy as np
-from datetime import datetime
+import msgspec
+import orjson
+import xxhash
+from numba import njit
+from collections import OrderedDict
+import base64
+from functools import wraps
+from typing import Any, Optional
+import threading
 import json
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, serializes NumPy arrays natively"""
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build the jsonify response from orjson's bytes directly, without a str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.option), mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
+class LRUCache:
+    """Small thread-safe LRU mapping shared by the request handler threads"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+# Encoded JSON responses keyed by (endpoint, payload hash)
+_response_cache = LRUCache(maxsize=128)
+
+# Aggregated totals keyed by (raw transactions hash, granularity), shared across endpoints in one worker process
+_aggregate_cache = LRUCache(maxsize=32)
+
+
+def cached_response(view):
+    """
+    Serve repeated identical payloads from the response cache
+    Endpoints are pure functions of the request body and query string, so dashboard polls with unchanged data skip NumPy entirely
+    """
+    @wraps(view)
+    def wrapper():
+        key = (view.__name__, request.query_string, xxhash.xxh3_64_hexdigest(request.get_data()))
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return Response(cached, mimetype='application/json')
+        
+        result = view()
+        
+        # Only successful responses are cached; errors are returned as (response, status) tuples
+        if isinstance(result, Response) and result.status_code == 200:
+            _response_cache.put(key, result.get_data())
+        return result
+    return wrapper
+
+
+# Per-thread pool of reusable NumPy work buffers
+_scratch = threading.local()
 
-def parse_date(date_str):
-    """Parse date string to datetime object"""
-    try:
-        if isinstance(date_str, str):
-            # Handle different date formats
-            if '-' in date_str:
-                parts = date_str.split('-')
-                if len(parts) == 3:
-                    return datetime(int(parts[0]), int(parts[1]), int(parts[2]))
-        return None
-    except:
-        return None
+
+def scratch(name, n, dtype=np.float64):
+    """
+    Return an uninitialized length-n view of this thread's reusable buffer called name
+    Buffers only grow, so repeated requests of similar size skip the allocator;
+    use them for temporaries only, never for arrays that end up in a response or cache
+    """
+    buf = getattr(_scratch, name, None)
+    if buf is None or buf.size < n or buf.dtype != dtype:
+        buf = np.empty(n, dtype=dtype)
+        setattr(_scratch, name, buf)
+    return buf[:n]
+
+
+def partition_percentiles(values, percentiles):
+    """
+    Compute min, max and linearly interpolated percentiles from one np.partition
+    Matches np.percentile's default method without sorting once per percentile
+    """
+    n = values.size
+    positions = np.asarray(percentiles, dtype=np.float64) / 100 * (n - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    kth = np.unique(np.concatenate(([0, n - 1], lower, upper)))
+    partitioned = scratch('partition', n, values.dtype)
+    partitioned[:] = values
+    partitioned.partition(kth)
+    lower_values = partitioned[lower]
+    result = lower_values + (partitioned[upper] - lower_values) * (positions - lower)
+    return partitioned[0], partitioned[n - 1], result
+
+
+class Transaction(msgspec.Struct):
+    """Single transaction as posted by the frontend; unknown fields are ignored"""
+    date: Any = ''  # Only read by the date-grouping endpoints
+    cost: float = 0.0
+    type: Optional[str] = ''
+
+
+class Payload(msgspec.Struct):
+    """Request body shared by all analytics endpoints"""
+    transactions: msgspec.Raw = msgspec.Raw(b'[]')  # Kept undecoded so the bytes can be hashed once
+    window_size: int = 7  # Default 7-day moving average
+    risk_free_rate: float = 0.02  # Default 2% annual
+    forecast_days: int = 30
+
+
+def encode_array(values, binary=False):
+    """
+    Prepare a NumPy array for the JSON response
+    By default the array is passed through and orjson writes it natively; with binary=True (?fmt=bin)
+    it becomes base64 little-endian float32 bytes that clients decode with a Float32Array
+    """
+    if not binary:
+        return values
+    
+    data = np.ascontiguousarray(values, dtype='<f4').tobytes()
+    return {'dtype': 'float32', 'length': len(values), 'data': base64.b64encode(data).decode('ascii')}
+
+
+def read_payload():
+    """
+    Decode the raw request body straight into typed structs with msgspec
+    Returns the payload and its transactions; payload.transactions keeps the raw JSON slice
+    Non-strict mode keeps accepting numeric strings such as "12.50" for costs
+    Raises msgspec.DecodeError/ValidationError for malformed bodies, which callers report as 400
+    """
+    data = msgspec.json.decode(request.get_data() or b'{}', type=Payload, strict=False)
+    raw = data.transactions
+    if len(raw) == 4 and bytes(raw) == b'null':
+        return data, []
+    transactions = msgspec.json.decode(raw, type=list[Transaction], strict=False)
+    return data, transactions
+
+
+def transaction_columns(transactions):
+    """
+    Split transactions into date, cost and type columns in a single pass
+    Returns the dates as a tuple, costs as a NumPy array and boolean income/expense masks;
+    types are compared row by row rather than stored as a fixed-width string array,
+    whose width (and memory) would be set by the longest client-supplied string
+    """
+    if not transactions:
+        return (), np.empty(0), np.empty(0, dtype=np.bool_), np.empty(0, dtype=np.bool_)
+    
+    n = len(transactions)
+    dates, costs, types = zip(*((t.date, t.cost, t.type) for t in transactions))
+    is_income = np.fromiter((t == 'income' for t in types), dtype=np.bool_, count=n)
+    is_expense = np.fromiter((t == 'expense' for t in types), dtype=np.bool_, count=n)
+    return dates, np.array(costs, dtype=np.float64), is_income, is_expense
+
+
+def aggregate_totals(transactions, raw_transactions, granularity='day'):
+    """
+    Income and expense totals per day or month, shared across endpoints
+    Results are cached by a hash of the raw transactions JSON and the granularity, so
+    requests with the same transactions handled by the same worker process group them once
+    Returns sorted keys and read-only income and expense arrays
+    """
+    key = (xxhash.xxh3_64_hexdigest(raw_transactions), granularity)
+    cached = _aggregate_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    keys, income, expense = _group_totals(transactions, month=(granularity == 'month'))
+    income.setflags(write=False)
+    expense.setflags(write=False)
+    _aggregate_cache.put(key, (keys, income, expense))
+    return keys, income, expense
+
+
+def _group_totals(transactions, month=False):
+    """
+    Group transactions by date (or by YYYY-MM when month=True) with NumPy
+    Dates are ISO formatted, so keys are fixed-width prefixes of the date string
+    Returns sorted keys and the income and expense totals for each key
+    """
+    dates, costs, is_income, _ = transaction_columns(transactions)
+    is_expense = ~is_income  # Anything that isn't income counts as an expense here
+    date_keys = np.array([d[:10] for d in dates], dtype=str)  # YYYY-MM-DD, drops any time part
+    
+    if month:
+        # One-time validation: rows without a dated key get zero weight instead of being filtered out
+        valid = np.char.find(date_keys, '-') >= 0
+        date_keys = date_keys.astype('<U7')  # YYYY-MM
+        is_income &= valid
+        is_expense &= valid
+    
+    # np.unique sorts the keys and maps every transaction to its group
+    keys, inverse = np.unique(date_keys, return_inverse=True)
+    income = np.zeros(len(keys))
+    expense = np.zeros_like(income)
+    # Branchless split: every transaction contributes to both totals, zero on the other side
+    income_values = np.where(is_income, costs, 0.0)
+    expense_values = np.where(is_expense, np.abs(costs), 0.0)
+    np.add.at(income, inverse, income_values)
+    np.add.at(expense, inverse, expense_values)
+    
+    if month:
+        # A group's rows are either all valid or all invalid, so scatter the row mask onto the groups
+        keep = np.zeros(len(keys), dtype=np.bool_)
+        keep[inverse] = valid
+        keys, income, expense = keys[keep], income[keep], expense[keep]
+    
+    return keys.tolist(), income, expense
+
+
+@njit('f8(f8[::1])', cache=True, fastmath=True, nogil=True)
+def max_drawdown(net_values):
+    """
+    Maximum drawdown of the cumulative net values in one streaming pass
+    Tracks the running sum and peak as scalars instead of allocating arrays
+    """
+    running_sum = 0.0
+    # Seed the peak from the first cumulative value: fastmath assumes no infinities, so no -inf sentinel
+    peak = net_values[0] if net_values.size > 0 else 0.0
+    min_drawdown = 0.0
+    for value in net_values:
+        running_sum += value
+        if running_sum > peak:
+            peak = running_sum
+        drawdown = (running_sum - peak) / (peak + 1e-10)
+        if drawdown < min_drawdown:
+            min_drawdown = drawdown
+    return min_drawdown
+
+
+@njit('UniTuple(f8, 6)(f8[::1], f8)', cache=True, fastmath=True, nogil=True)
+def _risk_kernel(net_values, rf_daily):
+    """
+    JIT-compiled core of the risk metrics on daily net values
+    Returns mean return, volatility, variance, Sharpe ratio, 95% VaR and max drawdown
+    """
+    # Calculate returns (daily changes)
+    returns = np.diff(net_values) / (np.abs(net_values[:-1]) + 1e-10)
+    mean_return = returns.mean()
+    volatility = returns.std()  # Standard deviation of returns
+    variance = volatility * volatility
+    
+    # Sharpe ratio (simplified - assumes daily returns)
+    sharpe_ratio = (mean_return - rf_daily) / (volatility + 1e-10) if volatility > 0 else 0.0
+    
+    # Value at Risk (VaR) - 95% confidence, 5th percentile interpolated from one partition
+    position = 0.05 * (returns.size - 1)
+    lower = int(position)
+    upper = min(lower + 1, returns.size - 1)
+    partitioned = np.partition(returns, np.array([lower, upper]))
+    var_95 = partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (position - lower)
+    
+    return mean_return, volatility, variance, sharpe_ratio, var_95, max_drawdown(net_values)
 
 
 @app.route('/api/financial/statistics', methods=['POST'])
+@cached_response
 def calculate_statistics():
     """
     Calculate statistical metrics for financial transactions using NumPy
     Returns: mean, median, std deviation, variance, min, max
     """
     try:
-        data = request.json
-        transactions = data.get('transactions', [])
+        data, transactions = read_payload()
         
         if not transactions:
             return jsonify({'error': 'No transactions provided'}), 400
         
-        # Extract amounts and convert to NumPy array
-        amounts = []
-        for txn in transactions:
-            amount = float(txn.get('cost', 0))
-            if txn.get('type') == 'expense':
-                amount = abs(amount)  # Make expenses positive for analysis
-            amounts.append(amount)
+        # Extract amounts straight into NumPy arrays
+        n = len(transactions)
+        _, costs, _, is_expense = transaction_columns(transactions)
+        amounts_array = np.where(is_expense, np.abs(costs), costs)  # Make expenses positive for analysis
+        
+        # Fused reductions: one sum and one dot product for mean/variance
+        total = amounts_array.sum()
+        mean = total / n
+        centered = amounts_array - mean
+        variance = (centered @ centered) / n
         
-        amounts_array = np.array(amounts)
+        # Single partition gives min, max, median and percentiles
+        amount_min, amount_max, (p25, p50, p75, p90) = partition_percentiles(amounts_array, [25, 50, 75, 90])
         
         # Calculate statistics using NumPy
         stats = {
-            'mean': float(np.mean(amounts_array)),
-            'median': float(np.median(amounts_array)),
-            'std_deviation': float(np.std(amounts_array)),
-            'variance': float(np.var(amounts_array)),
-            'min': float(np.min(amounts_array)),
-            'max': float(np.max(amounts_array)),
-            'total': float(np.sum(amounts_array)),
-            'count': len(amounts_array),
+            'mean': float(mean),
+            'median': float(p50),
+            'std_deviation': float(np.sqrt(variance)),
+            'variance': float(variance),
+            'min': float(amount_min),
+            'max': float(amount_max),
+            'total': float(total),
+            'count': n,
             'percentiles': {
-                '25th': float(np.percentile(amounts_array, 25)),
-                '50th': float(np.percentile(amounts_array, 50)),
-                '75th': float(np.percentile(amounts_array, 75)),
-                '90th': float(np.percentile(amounts_array, 90))
+                '25th': float(p25),
+                '50th': float(p50),
+                '75th': float(p75),
+                '90th': float(p90)
             }
         }
         
         return jsonify({'success': True, 'statistics': stats})
     
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/financial/trends', methods=['POST'])
+@cached_response
 def calculate_trends():
     """
     Calculate trend analysis including moving averages and growth rates
     Uses NumPy for efficient time series calculations
     """
     try:
-        data = request.json
-        transactions = data.get('transactions', [])
-        window_size = data.get('window_size', 7)  # Default 7-day moving average
+        data, transactions = read_payload()
+        binary = request.args.get('fmt') == 'bin'  # The query string is part of the response cache key
+        window_size = data.window_size
         
         if not transactions:
             return jsonify({'error': 'No transactions provided'}), 400
         
-        # Sort transactions by date
-        sorted_txns = sorted(transactions, key=lambda x: parse_date(x.get('date')) or datetime.min)
+        if window_size < 1:
+            return jsonify({'error': 'window_size must be at least 1'}), 400
         
-        # Extract daily totals
-        daily_totals = {}
-        for txn in sorted_txns:
-            date_str = txn.get('date', '')
-            date_key = date_str.split(' ')[0] if ' ' in date_str else date_str
-            
-            if date_key not in daily_totals:
-                daily_totals[date_key] = {'income': 0, 'expense': 0}
-            
-            amount = float(txn.get('cost', 0))
-            if txn.get('type') == 'income':
-                daily_totals[date_key]['income'] += amount
-            else:
-                daily_totals[date_key]['expense'] += abs(amount)
-        
-        # Convert to arrays sorted by date
-        dates = sorted(daily_totals.keys())
-        income_values = np.array([daily_totals[d]['income'] for d in dates])
-        expense_values = np.array([daily_totals[d]['expense'] for d in dates])
+        # Extract daily totals as arrays sorted by date (ISO keys sort lexicographically)
+        dates, income_values, expense_values = aggregate_totals(transactions, data.transactions)
         net_values = income_values - expense_values
         
-        # Calculate moving averages using NumPy convolution
+        # Calculate moving averages using NumPy cumulative sums
         if len(net_values) >= window_size:
-            # Simple moving average using convolution
-            weights = np.ones(window_size) / window_size
-            moving_avg = np.convolve(net_values, weights, mode='valid')
+            # Simple moving average in O(n) from differences of the running sum
+            cumulative = scratch('prefix_sum', len(net_values) + 1)
+            cumulative[0] = 0.0
+            np.cumsum(net_values, dtype=np.float64, out=cumulative[1:])
+            moving_avg = (cumulative[window_size:] - cumulative[:-window_size]) / window_size
             
             # Calculate growth rates
             growth_rates = np.diff(net_values) / (net_values[:-1] + 1e-10) * 100  # Avoid division by zero
             
             trends = {
                 'dates': dates[window_size-1:],
-                'moving_average': moving_avg.tolist(),
-                'net_values': net_values.tolist(),
+                'moving_average': encode_array(moving_avg, binary),
+                'net_values': encode_array(net_values, binary),
                 'average_growth_rate': float(np.mean(growth_rates)) if len(growth_rates) > 0 else 0,
                 'volatility': float(np.std(growth_rates)) if len(growth_rates) > 0 else 0
             }
         else:
             trends = {
                 'dates': dates,
-                'moving_average': net_values.tolist(),
-                'net_values': net_values.tolist(),
+                'moving_average': encode_array(net_values, binary),
+                'net_values': encode_array(net_values, binary),
                 'average_growth_rate': 0,
                 'volatility': 0
             }
         
         return jsonify({'success': True, 'trends': trends})
     
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/financial/risk-metrics', methods=['POST'])
+@cached_response
 def calculate_risk_metrics():
     """
     Calculate financial risk metrics including volatility and Sharpe ratio
     Uses NumPy for efficient risk calculations
     """
     try:
-        data = request.json
-        transactions = data.get('transactions', [])
-        risk_free_rate = data.get('risk_free_rate', 0.02)  # Default 2% annual
+        data, transactions = read_payload()
+        risk_free_rate = data.risk_free_rate
         
         if not transactions:
             return jsonify({'error': 'No transactions provided'}), 400
         
         # Extract daily net values
-        daily_totals = {}
-        for txn in transactions:
-            date_str = txn.get('date', '')
-            date_key = date_str.split(' ')[0] if ' ' in date_str else date_str
-            
-            if date_key not in daily_totals:
-                daily_totals[date_key] = {'income': 0, 'expense': 0}
-            
-            amount = float(txn.get('cost', 0))
-            if txn.get('type') == 'income':
-                daily_totals[date_key]['income'] += amount
-            else:
-                daily_totals[date_key]['expense'] += abs(amount)
-        
-        dates = sorted(daily_totals.keys())
-        net_values = np.array([daily_totals[d]['income'] - daily_totals[d]['expense'] for d in dates])
+        dates, income_values, expense_values = aggregate_totals(transactions, data.transactions)
+        net_values = income_values - expense_values
         
         if len(net_values) < 2:
             return jsonify({'error': 'Insufficient data for risk calculations'}), 400
         
-        # Calculate returns (daily changes)
-        returns = np.diff(net_values) / (np.abs(net_values[:-1]) + 1e-10)
-        
-        # Risk metrics using NumPy
-        mean_return = np.mean(returns)
-        volatility = np.std(returns)  # Standard deviation of returns
-        variance = np.var(returns)
-        
-        # Sharpe ratio (simplified - assumes daily returns)
-        sharpe_ratio = (mean_return - risk_free_rate / 365) / (volatility + 1e-10) if volatility > 0 else 0
-        
-        # Value at Risk (VaR) - 95% confidence
-        var_95 = np.percentile(returns, 5) if len(returns) > 0 else 0
-        
-        # Maximum drawdown
-        cumulative = np.cumsum(net_values)
-        running_max = np.maximum.accumulate(cumulative)
-        drawdown = (cumulative - running_max) / (running_max + 1e-10)
-        max_drawdown = float(np.min(drawdown)) if len(drawdown) > 0 else 0
+        # Risk metrics from the JIT-compiled NumPy kernel
+        mean_return, volatility, variance, sharpe_ratio, var_95, max_drawdown = _risk_kernel(
+            net_values, risk_free_rate / 365
+        )
         
         risk_metrics = {
             'volatility': float(volatility),
@@ -210,56 +434,43 @@ def calculate_risk_metrics():
         
         return jsonify({'success': True, 'risk_metrics': risk_metrics})
     
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
 @app.route('/api/financial/forecast', methods=['POST'])
+@cached_response
 def forecast_budget():
     """
     Simple budget forecasting using linear regression with NumPy
     Predicts future values based on historical trends
     """
     try:
-        data = request.json
-        transactions = data.get('transactions', [])
-        forecast_days = data.get('forecast_days', 30)
+        data, transactions = read_payload()
+        binary = request.args.get('fmt') == 'bin'  # The query string is part of the response cache key
+        forecast_days = data.forecast_days
         
         if not transactions:
             return jsonify({'error': 'No transactions provided'}), 400
         
-        # Extract monthly totals
-        monthly_totals = {}
-        for txn in transactions:
-            date_str = txn.get('date', '')
-            date_key = date_str.split(' ')[0] if ' ' in date_str else date_str
-            
-            if '-' in date_key:
-                year_month = '-'.join(date_key.split('-')[:2])  # YYYY-MM
-                
-                if year_month not in monthly_totals:
-                    monthly_totals[year_month] = {'income': 0, 'expense': 0}
-                
-                amount = float(txn.get('cost', 0))
-                if txn.get('type') == 'income':
-                    monthly_totals[year_month]['income'] += amount
-                else:
-                    monthly_totals[year_month]['expense'] += abs(amount)
+        # Extract monthly totals sorted by date
+        sorted_months, income_values, expense_values = aggregate_totals(transactions, data.transactions, granularity='month')
         
-        if len(monthly_totals) < 2:
+        if len(sorted_months) < 2:
             return jsonify({'error': 'Insufficient data for forecasting'}), 400
         
-        # Sort by date and extract values
-        sorted_months = sorted(monthly_totals.keys())
-        net_values = np.array([monthly_totals[m]['income'] - monthly_totals[m]['expense'] for m in sorted_months])
-        
-        # Create time indices
-        x = np.arange(len(net_values))
+        net_values = income_values - expense_values
         
-        # Simple linear regression using NumPy
-        # y = mx + b
-        A = np.vstack([x, np.ones(len(x))]).T
-        m, b = np.linalg.lstsq(A, net_values, rcond=None)[0]
+        # Simple linear regression in closed form over time indices 0..n-1
+        # y = mx + b, with m = cov(x, y) / var(x) and b = mean(y) - m * mean(x)
+        n = net_values.size
+        x_mean = (n - 1) / 2
+        y_mean = net_values.mean()
+        x_centered = np.arange(n) - x_mean
+        m = (x_centered @ (net_values - y_mean)) / (x_centered @ x_centered)
+        b = y_mean - m * x_mean
         
         # Forecast future values
         future_x = np.arange(len(net_values), len(net_values) + forecast_days // 30 + 1)
@@ -267,15 +478,17 @@ def forecast_budget():
         
         forecast = {
             'historical_months': sorted_months,
-            'historical_values': net_values.tolist(),
+            'historical_values': encode_array(net_values, binary),
             'forecast_months': [f"Forecast_{i+1}" for i in range(len(future_x))],
-            'forecast_values': forecast_values.tolist(),
+            'forecast_values': encode_array(forecast_values, binary),
             'trend_slope': float(m),
             'trend_intercept': float(b)
         }
         
         return jsonify({'success': True, 'forecast': forecast})
     
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -287,7 +500,9 @@ def health_check():
 
 
 if __name__ == '__main__':
+    # Single-process fallback for local development; production runs under gunicorn:
+    #   gunicorn --workers $((2 * $(getconf _NPROCESSORS_ONLN))) --worker-class gthread --threads 4 --bind 0.0.0.0:5001 python_service:app
     print("Starting Python Financial Analytics Service...")
     print("NumPy version:", np.__version__)
-    app.run(host='0.0.0.0', port=5001, debug=True)
+    app.run(host='0.0.0.0', port=5001)
 
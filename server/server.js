@@ -175,7 +175,7 @@ const PYTHON_SERVICE_URL = process.env.PYTHON_SERVICE_URL || 'http://localhost:5
 // Proxy endpoint for financial statistics
 app.post('/api/financial/statistics', async (req, res) => {
     try {
-        const response = await axios.post(`${PYTHON_SERVICE_URL}/api/financial/statistics`, req.body);
+        const response = await axios.post(`${PYTHON_SERVICE_URL}/api/financial/statistics`, req.body, { params: req.query });
         res.json(response.data);
     } catch (error) {
         console.error('Error calling Python service:', error.message);
@@ -186,7 +186,7 @@ app.post('/api/financial/statistics', async (req, res) => {
 // Proxy endpoint for trend analysis
 app.post('/api/financial/trends', async (req, res) => {
     try {
-        const response = await axios.post(`${PYTHON_SERVICE_URL}/api/financial/trends`, req.body);
+        const response = await axios.post(`${PYTHON_SERVICE_URL}/api/financial/trends`, req.body, { params: req.query });
         res.json(response.data);
     } catch (error) {
         console.error('Error calling Python service:', error.message);
@@ -197,7 +197,7 @@ app.post('/api/financial/trends', async (req, res) => {
 // Proxy endpoint for risk metrics
 app.post('/api/financial/risk-metrics', async (req, res) => {
     try {
-        const response = await axios.post(`${PYTHON_SERVICE_URL}/api/financial/risk-metrics`, req.body);
+        const response = await axios.post(`${PYTHON_SERVICE_URL}/api/financial/risk-metrics`, req.body, { params: req.query });
         res.json(response.data);
     } catch (error) {
         console.error('Error calling Python service:', error.message);
@@ -208,7 +208,7 @@ app.post('/api/financial/risk-metrics', async (req, res) => {
 // Proxy endpoint for budget forecasting
 app.post('/api/financial/forecast', async (req, res) => {
     try {
-        const response = await axios.post(`${PYTHON_SERVICE_URL}/api/financial/forecast`, req.body);
+        const response = await axios.post(`${PYTHON_SERVICE_URL}/api/financial/forecast`, req.body, { params: req.query });
         res.json(response.data);
     } catch (error) {
         console.error('Error calling Python service:', error.message);
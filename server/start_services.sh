@@ -4,10 +4,13 @@
 
 echo "Starting Finance Tracker Services..."
 
-# Start Python service in background
+# Start Python service in background (gunicorn, two threaded workers per CPU core)
 echo "Starting Python service on port 5001..."
 cd "$(dirname "$0")"
-python3 python_service.py &
+CPU_COUNT=$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo 2)
+PYTHON_WORKERS=${PYTHON_WORKERS:-$((2 * CPU_COUNT))}
+PYTHON_THREADS=${PYTHON_THREADS:-4}
+gunicorn --workers "$PYTHON_WORKERS" --worker-class gthread --threads "$PYTHON_THREADS" --bind 0.0.0.0:5001 python_service:app &
 PYTHON_PID=$!
 
 # Wait a moment for Python service to start